@@ -36,13 +36,33 @@ class MmapableIO(io.FileIO, metaclass=ABCMeta):
     def to_path(self) -> str: ...
 
     def to_bytes(self) -> bytes:
-        try:
-            with mmap.mmap(self.fileno(), 0, access=mmap.ACCESS_READ) as f:
-                return bytes(f)
-        except ValueError as e:
-            if e.args[0] == 'cannot mmap an empty file':
-                return b''
-            raise
+        # One fstat plus one pread copies the whole buffer out in a single syscall,
+        # rather than faulting an mmap in page by page.
+        fd = self.fileno()
+        size = os.fstat(fd).st_size
+        result = os.pread(fd, size, 0)
+        # Regular files and memfds satisfy the pread in one go, but don't assume it.
+        while len(result) < size:
+            chunk = os.pread(fd, size - len(result), len(result))
+            if not chunk:
+                break
+            result += chunk
+        return result
+
+    def reset(self) -> None:
+        # Empty and rewind the file so it can be reused for another case without
+        # paying for a fresh memfd. Not valid on sealed files.
+        os.ftruncate(self.fileno(), 0)
+        self.seek(0, os.SEEK_SET)
+
+    def to_memoryview(self) -> memoryview:
+        # A read-only view of the underlying pages: scanning it copies nothing, unlike
+        # to_bytes. The mapping stays alive for as long as the view does, even if this
+        # file is closed in the meantime.
+        size = os.fstat(self.fileno()).st_size
+        if not size:
+            return memoryview(b'')
+        return memoryview(mmap.mmap(self.fileno(), size, access=mmap.ACCESS_READ))
 
 
 class NamedFileIO(MmapableIO):
@@ -5,6 +5,7 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import traceback
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
@@ -124,6 +125,9 @@ class BaseExecutor(metaclass=ExecutorMeta):
     address_grace = 65536
     data_grace = 0
     fsize = 0
+    # Whether stderr feeds into feedback parsing; executors that never look at it may
+    # set this False so graders can skip capturing the stream entirely.
+    wants_stderr = True
     personality = 0x0040000  # ADDR_NO_RANDOMIZE
     fs: List[FilesystemAccessRule] = []
     write_fs: List[FilesystemAccessRule] = []
@@ -146,6 +150,9 @@ class BaseExecutor(metaclass=ExecutorMeta):
         self.source = source_code
         self._hints = hints or []
         self.unbuffered = unbuffered
+        # launch() mutates the shared submission directory; serialize that part so
+        # concurrent grade_batch launches don't trip over each other.
+        self._launch_lock = threading.Lock()
 
         for arg, value in kwargs.items():
             if not hasattr(self, arg):
@@ -273,20 +280,28 @@ class BaseExecutor(metaclass=ExecutorMeta):
 
     def launch(self, *args, **kwargs) -> TracedPopen:
         assert self._dir is not None
-        for src, dst in kwargs.get('symlinks', {}).items():
-            src = os.path.abspath(os.path.join(self._dir, src))
-            # Disallow the creation of symlinks outside the submission directory.
-            if os.path.commonprefix([src, self._dir]) == self._dir:
-                # If a link already exists under this name, it's probably from a
-                # previous case, but might point to something different.
-                if os.path.islink(src):
-                    os.unlink(src)
-                os.symlink(dst, src)
-            else:
-                raise InternalError('cannot symlink outside of submission directory')
-
-        agent = self._file('setbufsize.so')
-        shutil.copyfile(setbufsize_path, agent)
+        with self._launch_lock:
+            for src, dst in kwargs.get('symlinks', {}).items():
+                src = os.path.abspath(os.path.join(self._dir, src))
+                # Disallow the creation of symlinks outside the submission directory.
+                if os.path.commonprefix([src, self._dir]) == self._dir:
+                    # If a link already exists under this name, it's probably from a
+                    # previous case, but might point to something different.
+                    if os.path.islink(src):
+                        os.unlink(src)
+                    os.symlink(dst, src)
+                else:
+                    raise InternalError('cannot symlink outside of submission directory')
+
+            agent = self._file('setbufsize.so')
+            # The agent is immutable, so copy it into the submission directory only on
+            # the first launch; on later cases of the same submission it's already in
+            # place. Copy to a temporary name and rename it in, so the existence check
+            # can never see (and a child never LD_PRELOAD) a half-written library.
+            if not os.path.isfile(agent):
+                agent_tmp = f'{agent}.tmp'
+                shutil.copyfile(setbufsize_path, agent_tmp)
+                os.replace(agent_tmp, agent)
         child_env = {
             # Forward LD_LIBRARY_PATH for systems (e.g. Android Termux) that require
             # it to find shared libraries
@@ -1,4 +1,6 @@
-from typing import Optional, TYPE_CHECKING
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set, TYPE_CHECKING
 
 from dmoj.cptbox import TracedPopen
 from dmoj.executors.base_executor import BaseExecutor
@@ -16,7 +18,6 @@ class BaseGrader:
     problem: Problem
     judge: 'JudgeWorker'
     binary: BaseExecutor
-    _current_proc: Optional[TracedPopen]
 
     def __init__(self, judge: 'JudgeWorker', problem: Problem, language: str, source: bytes) -> None:
         self.source = utf8bytes(source)
@@ -25,18 +26,63 @@ class BaseGrader:
         self.judge = judge
         self.binary = self._generate_binary()
         self._abort_requested = False
-        self._current_proc = None
+        # Per-case state (e.g. the submission process) is keyed by thread so that
+        # `grade_batch` can judge several cases concurrently without them
+        # clobbering each other.
+        self._case_state = threading.local()
+        self._live_procs: Set[TracedPopen] = set()
+        self._live_procs_lock = threading.Lock()
+
+    @property
+    def _current_proc(self) -> Optional[TracedPopen]:
+        return getattr(self._case_state, 'proc', None)
+
+    @_current_proc.setter
+    def _current_proc(self, proc: Optional[TracedPopen]) -> None:
+        with self._live_procs_lock:
+            old_proc = getattr(self._case_state, 'proc', None)
+            if old_proc is not None:
+                self._live_procs.discard(old_proc)
+            if proc is not None:
+                self._live_procs.add(proc)
+        self._case_state.proc = proc
 
     def grade(self, case: TestCase) -> Result:
         raise NotImplementedError
 
+    def grade_batch(self, cases: List[TestCase], concurrency: int) -> List[Result]:
+        # Per-case symlinks are created in the shared submission directory, so a case
+        # that declares them could be judged against another case's links; grade such
+        # problems sequentially.
+        if any(case.config.symlinks for case in cases):
+            return [self.grade(case) for case in cases]
+
+        # Cases in the same batch may share state (e.g. a stateful generator), so they
+        # are grouped onto a single thread; distinct batches and non-batched cases are
+        # independent, and are judged in parallel up to `concurrency` workers.
+        groups: List[List[TestCase]] = []
+        for case in cases:
+            if case.batch and groups and groups[-1][-1].batch == case.batch:
+                groups[-1].append(case)
+            else:
+                groups.append([case])
+
+        def grade_group(group: List[TestCase]) -> List[Result]:
+            return [self.grade(case) for case in group]
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = [pool.submit(grade_group, group) for group in groups]
+            return [result for future in futures for result in future.result()]
+
     def _generate_binary(self) -> BaseExecutor:
         raise NotImplementedError
 
     def abort_grading(self) -> None:
         self._abort_requested = True
-        if self._current_proc:
+        with self._live_procs_lock:
+            procs = list(self._live_procs)
+        for proc in procs:
             try:
-                self._current_proc.kill()
+                proc.kill()
             except OSError:
                 pass
@@ -1,19 +1,22 @@
 import os
 import shlex
 import subprocess
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Type
 
 from dmoj.checkers import CheckerOutput
 from dmoj.config import ConfigNode
 from dmoj.contrib import contrib_modules
+from dmoj.contrib.base import BaseContribModule
 from dmoj.cptbox.filesystem_policies import ExactFile
+from dmoj.cptbox.utils import MemoryIO
 from dmoj.error import CompileError, InternalError
 from dmoj.executors.base_executor import BaseExecutor
 from dmoj.graders.standard import StandardGrader
 from dmoj.judgeenv import env, get_problem_root
 from dmoj.problem import Problem, TestCase
 from dmoj.result import Result
-from dmoj.utils.helper_files import compile_with_auxiliary_files, mktemp
+from dmoj.utils.helper_files import compile_with_auxiliary_files
+from dmoj.utils.os_ext import close_fds, make_pipe
 from dmoj.utils.unicode import utf8text
 
 if TYPE_CHECKING:
@@ -38,20 +41,46 @@ class BridgedInteractiveGrader(StandardGrader):
         self.contrib_type = self.handler_data.get('type', 'default')
         if self.contrib_type not in contrib_modules:
             raise InternalError(f'{self.contrib_type} is not a valid contrib module')
+        # Resolve the contrib module class once; check_result would otherwise repeat
+        # the dict lookup and attribute chain on every case.
+        self._contrib_module: Type[BaseContribModule] = contrib_modules[self.contrib_type].ContribModule
+
+        args_format_string = (
+            self.handler_data.args_format_string or self._contrib_module.get_interactor_args_format_string()
+        )
+        # Tokenize the format string once; per case we only substitute paths into the
+        # pre-split tokens, which skips shlex on the hot path and needs no quoting.
+        self._interactor_args_template = shlex.split(args_format_string)
+
+        # These are identical for every case, and ConfigNode lookups walk the config
+        # chain, so read them once here rather than on the per-case path.
+        # Give TL + 2s by default, so we do not race (and incorrectly throw IE) if submission gets TLE
+        self._interactor_time_limit = (self.handler_data.preprocessing_time or 2) + self.problem.time_limit
+        self._interactor_memory_limit = self.handler_data.memory_limit or env['generator_memory_limit']
+        self._packet_pipes = bool(self.handler_data.get('packet_pipes', False))
+        self._wants_feedback = bool(self.handler_data.feedback)
+        # Degenerate "interactors" that just feed the input at the submission and
+        # check what comes back don't need an interactor process at all: the
+        # submission can read the input memfd directly and the normal checker judges
+        # its output, skipping a process launch and two pipes per case.
+        self._passthrough_input = bool(self.handler_data.get('passthrough_input', False))
 
     def check_result(self, case: TestCase, result: Result) -> CheckerOutput:
+        if self._passthrough_input:
+            return super().check_result(case, result)
+
         # We parse the return code first in case the grader crashed, so it can raise the IE.
         # Usually a grader crash will result in IR/RTE/TLE,
         # so checking submission return code first will cover up the grader fail.
-        assert self._interactor.stderr is not None
-        stderr = self._interactor.stderr.read()
-        parsed_result = contrib_modules[self.contrib_type].ContribModule.parse_return_code(
-            self._interactor,
+        interactor = self._case_state.interactor
+        stderr = self._case_state.interactor_stderr
+        parsed_result = self._contrib_module.parse_return_code(
+            interactor,
             self.interactor_binary,
             case.points,
             self._interactor_time_limit,
             self._interactor_memory_limit,
-            feedback=utf8text(stderr) if self.handler_data.feedback else '',
+            feedback=utf8text(stderr) if self._wants_feedback else '',
             name='interactor',
             stderr=stderr,
         )
@@ -59,8 +88,16 @@ class BridgedInteractiveGrader(StandardGrader):
         return (not result.result_flag) and parsed_result
 
     def _launch_process(self, case: TestCase, input_file=None) -> None:
-        self._interactor_stdin_pipe, submission_stdout_pipe = os.pipe()
-        submission_stdin_pipe, self._interactor_stdout_pipe = os.pipe()
+        if self._passthrough_input:
+            super()._launch_process(case, input_file)
+            return
+
+        # The submission reads from the interactor rather than the input file, but keep
+        # the handle `grade` materialized so `_interact_with_process` reuses it instead
+        # of fetching the input a second time.
+        self._case_state.input_file = input_file or case.input_data_io()
+        self._case_state.interactor_stdin_pipe, submission_stdout_pipe = make_pipe(self._packet_pipes)
+        submission_stdin_pipe, self._case_state.interactor_stdout_pipe = make_pipe(self._packet_pipes)
         self._current_proc = self.binary.launch(
             time=self.problem.time_limit,
             memory=self.problem.memory_limit,
@@ -70,53 +107,81 @@ class BridgedInteractiveGrader(StandardGrader):
             stderr=subprocess.PIPE,
             wall_time=case.config.wall_time_factor * self.problem.time_limit,
         )
-        os.close(submission_stdin_pipe)
-        os.close(submission_stdout_pipe)
+        close_fds(submission_stdin_pipe, submission_stdout_pipe)
 
     def _interact_with_process(self, case: TestCase, result: Result) -> bytes:
+        if self._passthrough_input:
+            return super()._interact_with_process(case, result)
+
         assert self._current_proc is not None
         assert self._current_proc.stderr is not None
 
         judge_output = case.output_data()
-        # Give TL + 2s by default, so we do not race (and incorrectly throw IE) if submission gets TLE
-        self._interactor_time_limit = (self.handler_data.preprocessing_time or 2) + self.problem.time_limit
-        self._interactor_memory_limit = self.handler_data.memory_limit or env['generator_memory_limit']
-        args_format_string = (
-            self.handler_data.args_format_string
-            or contrib_modules[self.contrib_type].ContribModule.get_interactor_args_format_string()
-        )
 
-        with mktemp(judge_output) as answer_file:
-            input_path = case.input_data_io().to_path()
+        # The answer file lives in a memfd exposed through /proc, like the input file,
+        # so the interactor reads it from RAM instead of a freshly written temp file.
+        with MemoryIO(prefill=judge_output, seal=True) as answer_file:
+            # The answer now lives in the memfd, and this grading path never touches
+            # it again; release the parent-side bytes rather than pinning them for
+            # the duration of the interaction.
+            del judge_output
+            case.free_output_data()
+
+            answer_path = answer_file.to_path()
+            input_path = self._case_state.input_file.to_path()
 
             # TODO(@kirito): testlib.h expects a file they can write to,
             # but we currently don't have a sane way to allow this.
             # Thus we pass /dev/null for now so testlib interactors will still
             # work, albeit with diminished capabilities
-            interactor_args = shlex.split(
-                args_format_string.format(
-                    input_file=shlex.quote(input_path),
-                    output_file=shlex.quote(os.devnull),
-                    answer_file=shlex.quote(answer_file.name),
-                )
-            )
-            self._interactor = self.interactor_binary.launch(
+            interactor_args = [
+                token.format(input_file=input_path, output_file=os.devnull, answer_file=answer_path)
+                for token in self._interactor_args_template
+            ]
+            # Collect interactor stderr in a memfd rather than a pipe: feedback can be
+            # arbitrarily long, and a full pipe would block the interactor mid-case.
+            # The memfd is pooled per worker thread and reset between cases, so only
+            # the first case on a thread pays for creating it.
+            interactor_stderr_io = getattr(self._case_state, 'interactor_stderr_io', None)
+            if interactor_stderr_io is None:
+                interactor_stderr_io = self._case_state.interactor_stderr_io = MemoryIO()
+            else:
+                interactor_stderr_io.reset()
+            self._case_state.interactor = self.interactor_binary.launch(
                 *interactor_args,
                 time=self._interactor_time_limit,
                 memory=self._interactor_memory_limit,
-                stdin=self._interactor_stdin_pipe,
-                stdout=self._interactor_stdout_pipe,
-                stderr=subprocess.PIPE,
-                extra_fs=[ExactFile(input_path)],
+                stdin=self._case_state.interactor_stdin_pipe,
+                stdout=self._case_state.interactor_stdout_pipe,
+                stderr=interactor_stderr_io,
+                extra_fs=[ExactFile(input_path), ExactFile(answer_path)],
             )
 
-            os.close(self._interactor_stdin_pipe)
-            os.close(self._interactor_stdout_pipe)
+            close_fds(self._case_state.interactor_stdin_pipe, self._case_state.interactor_stdout_pipe)
+
+            # Drain submission stderr to EOF before reaping: a submission that filled
+            # the stderr pipe would otherwise block on write and never exit, stalling
+            # the case until the wall clock killed it. The interactor's stderr is a
+            # memfd, so it can't hit this. Keep only up to the errlimit the standard
+            # grader enforces, and discard the rest as it streams in, so a submission
+            # spewing stderr can't balloon judge memory either.
+            stderr_chunks = []
+            stderr_length = 0
+            while True:
+                chunk = self._current_proc.stderr.read(4096)
+                if not chunk:
+                    break
+                if stderr_length < 1048576:
+                    stderr_chunks.append(chunk)
+                    stderr_length += len(chunk)
+            submission_stderr = b''.join(stderr_chunks)
 
             self._current_proc.wait()
-            self._interactor.wait()
+            self._case_state.interactor.wait()
+
+            self._case_state.interactor_stderr = interactor_stderr_io.to_bytes()
 
-            return self._current_proc.stderr.read()
+            return submission_stderr
 
     def _generate_interactor_binary(self) -> BaseExecutor:
         files = self.handler_data.files
@@ -103,8 +103,6 @@ class Interactor:
 
 
 class InteractiveGrader(StandardGrader):
-    check: CheckerOutput
-
     def _launch_process(self, case, input_file=None):
         super()._launch_process(case, input_file=None)
 
@@ -113,13 +111,13 @@ class InteractiveGrader(StandardGrader):
         assert self._current_proc.stderr is not None
 
         interactor = Interactor(self._current_proc)
-        self.check = False
-        self.feedback = None
+        self._case_state.check = False
+        self._case_state.feedback = None
         try:
-            self.check = self.interact(case, interactor)
+            self._case_state.check = self.interact(case, interactor)
             interactor.close()
         except WrongAnswer as wa:
-            self.feedback = str(wa)
+            self._case_state.feedback = str(wa)
         except IOError:
             pass
 
@@ -132,9 +130,10 @@ class InteractiveGrader(StandardGrader):
             # has issued the AC verdict
             # This results in a TLE verdict getting full points, which should not be the case
             return False
-        if not isinstance(self.check, CheckerResult):
-            return CheckerResult(self.check, case.points if self.check else 0.0, feedback=self.feedback)
-        return self.check
+        check = self._case_state.check
+        if not isinstance(check, CheckerResult):
+            return CheckerResult(check, case.points if check else 0.0, feedback=self._case_state.feedback)
+        return check
 
     def interact(self, case: TestCase, interactor: Interactor) -> CheckerOutput:
         raise NotImplementedError
@@ -1,35 +1,55 @@
 import logging
+import os
 import subprocess
+from functools import partial
+from typing import Dict, TYPE_CHECKING, Tuple
 
 from dmoj.checkers import CheckerOutput
+from dmoj.config import ConfigNode
 from dmoj.cptbox import TracedPopen
 from dmoj.cptbox.lazy_bytes import LazyBytes
 from dmoj.error import OutputLimitExceeded
 from dmoj.executors import executors
 from dmoj.executors.base_executor import BaseExecutor
 from dmoj.graders.base import BaseGrader
-from dmoj.problem import TestCase
+from dmoj.problem import Problem, TestCase
 from dmoj.result import CheckerResult, Result
 
+if TYPE_CHECKING:
+    from dmoj.judge import JudgeWorker
+
 log = logging.getLogger('dmoj.graders')
 
 
 class StandardGrader(BaseGrader):
+    def __init__(self, judge: 'JudgeWorker', problem: Problem, language: str, source: bytes) -> None:
+        super().__init__(judge, problem, language, source)
+        # Maps the identity of a case's raw checker config to the loaded checker and
+        # its run_on_error flag; cases sharing a checker (the common case) construct
+        # it only once, and already-failed cases don't pay checker-loading machinery
+        # just to read run_on_error.
+        self._checker_cache: Dict[int, Tuple[partial, bool]] = {}
+
     def grade(self, case: TestCase) -> Result:
         result = Result(case)
 
         input_file = case.input_data_io()
 
-        self._launch_process(case, input_file)
+        try:
+            self._launch_process(case, input_file)
 
-        error = self._interact_with_process(case, result)
+            error = self._interact_with_process(case, result)
 
-        process = self._current_proc
+            process = self._current_proc
 
-        assert process is not None
-        self.populate_result(error, result, process)
-
-        check = self.check_result(case, result)
+            assert process is not None
+            check = self.finalize(case, result, error, process)
+        finally:
+            # Drop the reaped process from the thread-local and the live set: the
+            # worker thread may never grade another case, so this is the only place
+            # the reference (and any fds it holds open) is guaranteed released, and
+            # it keeps abort_grading from signalling an already-reaped pid.
+            self._current_proc = None
 
         # checkers must either return a boolean (True: full points, False: 0 points)
         # or a CheckerResult, so convert to CheckerResult if it returned bool
@@ -45,6 +65,13 @@ class StandardGrader(BaseGrader):
 
         return result
 
+    def finalize(self, case: TestCase, result: Result, error: bytes, process: TracedPopen) -> CheckerOutput:
+        # Populating the result and checking it are separate passes by default.
+        # Graders that scan a large proc_output in both steps can override this with a
+        # fused single-traversal implementation.
+        self.populate_result(error, result, process)
+        return self.check_result(case, result)
+
     def populate_result(self, error: bytes, result: Result, process: TracedPopen) -> None:
         self.binary.populate_result(error, result, process)
 
@@ -53,9 +80,8 @@ class StandardGrader(BaseGrader):
         # We shouldn't run checkers if the submission is already known to be incorrect, because some checkers
         # might be very computationally expensive.
         # See https://github.com/DMOJ/judge-server/issues/170
-        checker = case.checker()
-        # checker is a `partial` object, NOT a `function` object
-        if not result.result_flag or getattr(checker.func, 'run_on_error', False):
+        checker, run_on_error = self._case_checker(case)
+        if not result.result_flag or run_on_error:
             try:
                 check = checker(
                     result.proc_output,
@@ -82,16 +108,42 @@ class StandardGrader(BaseGrader):
 
         return check
 
+    def _case_checker(self, case: TestCase) -> Tuple[partial, bool]:
+        # Keyed by the identity of the raw config value, so cases that inherit the
+        # problem-level checker share an entry while per-case overrides get their own.
+        raw_config = case.config['checker']
+        if isinstance(raw_config, ConfigNode):
+            raw_config = raw_config.unwrap()
+        key = id(raw_config)
+        try:
+            return self._checker_cache[key]
+        except KeyError:
+            checker = case.checker()
+            # checker is a `partial` object, NOT a `function` object
+            entry = self._checker_cache[key] = (checker, getattr(checker.func, 'run_on_error', False))
+            return entry
+
     def _launch_process(self, case: TestCase, input_file=None) -> None:
-        self._current_proc = self.binary.launch(
-            time=self.problem.time_limit,
-            memory=self.problem.memory_limit,
-            symlinks=case.config.symlinks,
-            stdin=input_file or subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            wall_time=case.config.wall_time_factor * self.problem.time_limit,
-        )
+        # Executors that declare they never parse stderr get /dev/null instead,
+        # saving the pipe and its drain through communicate().
+        devnull_fd = None
+        if self.binary.wants_stderr:
+            stderr = subprocess.PIPE
+        else:
+            stderr = devnull_fd = os.open(os.devnull, os.O_WRONLY)
+        try:
+            self._current_proc = self.binary.launch(
+                time=self.problem.time_limit,
+                memory=self.problem.memory_limit,
+                symlinks=case.config.symlinks,
+                stdin=input_file or subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                wall_time=case.config.wall_time_factor * self.problem.time_limit,
+            )
+        finally:
+            if devnull_fd is not None:
+                os.close(devnull_fd)
 
     def _interact_with_process(self, case: TestCase, result: Result) -> bytes:
         process = self._current_proc
@@ -345,6 +345,7 @@ class TestCase(BaseTestCase):
     output_prefix_length: int
     has_binary_data: bool
     _input_data_io: Optional[MmapableIO]
+    _output_data: Optional[bytes]
     _generated: Optional[Tuple[MmapableIO, bytes]]
 
     def __init__(self, count: int, batch_no: int, config: ConfigNode, problem: Problem):
@@ -357,6 +358,7 @@ class TestCase(BaseTestCase):
         self.has_binary_data = config.binary_data
         self._generated = None
         self._input_data_io = None
+        self._output_data = None
 
     def _normalize(self, data: bytes) -> bytes:
         # Perhaps the correct answer may be 'no output', in which case it'll be
@@ -482,6 +484,14 @@ class TestCase(BaseTestCase):
             return MemoryIO(seal=True)
 
     def output_data(self) -> bytes:
+        # Cached: graders may ask for the answer several times per case (e.g. once to
+        # seed the interactor's answer file and once for the checker), and it can be a
+        # large read off disk.
+        if self._output_data is None:
+            self._output_data = self._make_output_data()
+        return self._output_data
+
+    def _make_output_data(self) -> bytes:
         if self.config.out:
             return self._normalize(self.problem.problem_data[self.config.out])
         gen = self.config.generator
@@ -514,8 +524,14 @@ class TestCase(BaseTestCase):
 
         return partial(checker.check, **params)
 
+    def free_output_data(self) -> None:
+        # Graders that copy the answer elsewhere (e.g. into an interactor's memfd)
+        # can drop the cached bytes early instead of pinning them for the whole case.
+        self._output_data = None
+
     def free_data(self) -> None:
         self._generated = None
+        self.free_output_data()
         if self._input_data_io:
             self._input_data_io.close()
 
@@ -524,7 +540,7 @@ class TestCase(BaseTestCase):
 
     # FIXME(tbrindus): this is a hack working around the fact we can't pickle these fields, but we do need parts of
     # TestCase itself on the other end of the IPC.
-    _pickle_blacklist = ('_generated', 'config', 'problem', '_input_data_io')
+    _pickle_blacklist = ('_generated', 'config', 'problem', '_input_data_io', '_output_data')
 
     def __getstate__(self) -> dict:
         k = {k: v for k, v in self.__dict__.items() if k not in self._pickle_blacklist}
@@ -14,6 +14,26 @@ class TestMemoryIO(unittest.TestCase):
             f.seek(0, os.SEEK_SET)
             self.assertEqual(f.read(), TEST_DATA)
 
+    def test_to_bytes(self):
+        with MemoryIO() as f:
+            self.assertEqual(f.to_bytes(), b'')
+            f.write(TEST_DATA)
+            self.assertEqual(f.to_bytes(), TEST_DATA)
+
+    def test_reset(self):
+        with MemoryIO() as f:
+            f.write(TEST_DATA)
+            f.reset()
+            self.assertEqual(f.to_bytes(), b'')
+            f.write(TEST_DATA)
+            self.assertEqual(f.to_bytes(), TEST_DATA)
+
+    def test_to_memoryview(self):
+        with MemoryIO() as f:
+            self.assertEqual(bytes(f.to_memoryview()), b'')
+            f.write(TEST_DATA)
+            self.assertEqual(bytes(f.to_memoryview()), TEST_DATA)
+
     @unittest.skipIf(sys.platform.startswith('freebsd'), 'Sealing not supported on FreeBSD')
     def test_seal(self):
         with MemoryIO() as f: